@@ -1,73 +1,97 @@
 """
 PyInstallerを使用したパッケージング用スクリプト
 """
+import argparse
+import importlib.util
 import os
 import sys
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
-def create_executable():
-    """PyInstallerを使用して実行ファイルを作成する"""
+APP_NAME = "ocr_translator"
+# アプリでは使わないがPyInstallerが拾ってしまう標準モジュール・テスト系モジュール
+EXCLUDED_MODULES = ("tkinter", "unittest", "test", "pytest")
+
+def _remove_output_dir(path, fallback):
+    """
+    出力ディレクトリを削除する。ロックされている場合は削除せず代替パスを返す。
+    """
+    try:
+        if os.path.exists(path):
+            shutil.rmtree(path)
+            print(f"既存の '{path}' フォルダを削除しました。")
+    except Exception as exc:
+        print(f"{path} フォルダの削除に失敗したためスキップします: {exc}")
+        return fallback
+    return path
+
+def _is_module_installed(import_name):
+    """モジュールを読み込まずにインストール済みかどうかを判定する"""
+    try:
+        return importlib.util.find_spec(import_name) is not None
+    except ModuleNotFoundError:
+        # "google.genai" のように親パッケージ自体が無い場合
+        return False
+
+def create_executable(pack="onedir"):
+    """
+    PyInstallerを使用して実行ファイルを作成する
+
+    Args:
+        pack (str): "onedir"（フォルダ形式）または "onefile"（単一ファイル）。
+            onefile は起動のたびに一時フォルダへの展開が走り、キャプチャごとに
+            起動する翻訳サブプロセスも遅くなるため、既定は onedir とする。
+    """
     print("PyInstallerを使用して実行ファイルを作成します...")
     
     # ビルドディレクトリと配布ディレクトリをクリーンアップ
     # ロックされている場合はスキップし、新しい dist/build パスを使う
     dist_dir = "dist"
     build_dir = "build"
-    try:
-        if os.path.exists(dist_dir):
-            shutil.rmtree(dist_dir)
-            print("既存の 'dist' フォルダを削除しました。")
-    except Exception as exc:
-        print(f"dist フォルダの削除に失敗したためスキップします: {exc}")
-        dist_dir = "dist_new"
-    try:
-        if os.path.exists(build_dir):
-            shutil.rmtree(build_dir)
-            print("既存の 'build' フォルダを削除しました。")
-    except Exception as exc:
-        print(f"build フォルダの削除に失敗したためスキップします: {exc}")
-        build_dir = "build_new"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dist_dir, build_dir = executor.map(
+            _remove_output_dir,
+            (dist_dir, build_dir),
+            ("dist_new", "build_new"),
+        )
     # 旧名称のspecも掃除（日本語名を避けるためASCII名に統一）
     for spec_name in ("OCR翻訳ツール.spec", "スクショAI翻訳.spec", "ocr_translator.spec"):
         if os.path.exists(spec_name):
             os.remove(spec_name)
             print(f"既存の '{spec_name}' を削除しました。")
     
-    # PyInstallerがインストールされているか確認
-    try:
-        import PyInstaller
-    except ImportError:
-        print("PyInstallerがインストールされていません。インストールします...")
-        subprocess.call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-    
-    # 必要なライブラリがインストールされているか確認
+    # 必要なライブラリがインストールされているか確認（読み込みはせず存在だけを調べる）
     required_packages = [
+        ("PyInstaller", "pyinstaller"),
         ("PyQt5", "PyQt5"),
-        ("PIL", "Pillow"),
         ("google.genai", "google-genai"),
     ]
-    for import_name, package_name in required_packages:
-        try:
-            __import__(import_name)
-        except ImportError:
-            print(f"{package_name}がインストールされていません。インストールします...")
-            subprocess.call([sys.executable, "-m", "pip", "install", package_name])
+    missing_packages = [
+        package_name
+        for import_name, package_name in required_packages
+        if not _is_module_installed(import_name)
+    ]
+    if missing_packages:
+        print(f"{', '.join(missing_packages)}がインストールされていません。インストールします...")
+        subprocess.call([sys.executable, "-m", "pip", "install", *missing_packages])
     
     # PyInstallerコマンドの構築
     pyinstaller_cmd = [
         sys.executable,
         "-m",
         "PyInstaller",
-        "--name=ocr_translator",  # ASCII名に統一
+        f"--name={APP_NAME}",  # ASCII名に統一
         f"--distpath={dist_dir}",
         f"--workpath={build_dir}",
         "--windowed",  # GUIアプリケーション
-        "--onefile",   # 単一の実行ファイル
+        f"--{pack}",
         "--add-data=src/prompts/vision_translation_prompt.md;src/prompts",
         "--icon=resources/icon.ico",  # アイコン（存在する場合）
         "main.py"
     ]
+    for module_name in EXCLUDED_MODULES:
+        pyinstaller_cmd.insert(-1, f"--exclude-module={module_name}")
     
     # アイコンファイルが存在しない場合は、そのオプションを削除
     if not os.path.exists("resources/icon.ico"):
@@ -78,7 +102,19 @@ def create_executable():
     subprocess.call(pyinstaller_cmd)
     
     print("ビルドが完了しました。")
-    print("実行ファイルは 'dist' フォルダ内に作成されました。")
+    if pack == "onefile":
+        output_path = os.path.join(dist_dir, f"{APP_NAME}.exe")
+    else:
+        output_path = os.path.join(dist_dir, APP_NAME, f"{APP_NAME}.exe")
+    print(f"実行ファイルは '{output_path}' に作成されました。")
 
 if __name__ == "__main__":
-    create_executable()
+    parser = argparse.ArgumentParser(description="PyInstallerで実行ファイルを作成します")
+    parser.add_argument(
+        "--pack",
+        choices=("onedir", "onefile"),
+        default="onedir",
+        help="出力形式（既定: onedir。onefile は起動が遅くなります）",
+    )
+    args = parser.parse_args()
+    create_executable(args.pack)
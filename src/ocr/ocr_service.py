@@ -1,16 +1,17 @@
 import abc
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtGui import QImage, QPixmap
 
 class OCRService(abc.ABC):
     """OCRサービスのための抽象基底クラス"""
 
     @abc.abstractmethod
-    def extract_text(self, pixmap: QPixmap, lang: str = None) -> str:
+    def extract_text(self, pixmap: QPixmap | QImage | bytes, lang: str = None) -> str:
         """
         画像からテキストを抽出する抽象メソッド。
 
         Args:
-            pixmap (QPixmap): 処理する画像。
+            pixmap (QPixmap | QImage | bytes): 処理する画像。ワーカースレッドから呼ぶ場合は
+                QImage またはエンコード済みのバイト列を渡す（QPixmap はGUIスレッド専用）。
             lang (str, optional): OCR言語。指定がなければ実装側でデフォルト言語を使用。
 
         Returns:
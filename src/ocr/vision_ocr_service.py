@@ -1,31 +1,34 @@
-import base64
 import logging
-from io import BytesIO
+from typing import Callable
 
-from PIL import Image
-from PyQt5.QtCore import QBuffer, QIODevice
 from PyQt5.QtGui import QImage, QPixmap
 
 from ..utils.google_ai import (
+    build_image_part,
     create_google_client,
     format_model_chain,
+    generate_with_model_fallback,
     get_google_model_candidates,
-    should_retry_with_fallback,
 )
+from ..utils.image_utils import detect_image_mime_type, encode_capture_image
+from ..utils.result_cache import build_cache_key, get_persistent_cache
 from ..utils.settings_manager import SettingsManager
 from ..utils.utils import handle_exception, sanitize_sensitive_data
 from .ocr_service import OCRService
 
 logger = logging.getLogger("ocr_translator")
 
+OCR_PROMPT = "画像内のテキストを改行を保ったまま抽出してください。OCR のみを行い、余計な説明は不要です。"
+OCR_LANGUAGE_HINT = "テキストの言語は{lang}です。"
+
 
 class VisionOCRService(OCRService):
     """
     Google AI (Vision) を使用して画像からテキストを抽出するサービス。
     """
 
-    def __init__(self):
-        self.settings_manager = SettingsManager()
+    def __init__(self, settings_manager: SettingsManager | None = None):
+        self.settings_manager = settings_manager or SettingsManager()
         logger.info("VisionOCRServiceを初期化しました")
 
     def is_available(self) -> bool:
@@ -35,81 +38,68 @@ class VisionOCRService(OCRService):
             return False
         return True
 
-    def _generate_with_model_fallback(self, prompt_text: str, pil_image: Image.Image, timeout: int):
-        """Auto mode では一時的な障害時にフォールバックモデルへ切り替える。"""
-        model_candidates = get_google_model_candidates(self.settings_manager)
-        last_error: Exception | None = None
-        client = create_google_client(self.settings_manager.get_api_key("gemini") or "")
-
-        for index, model_name in enumerate(model_candidates):
-            try:
-                response = client.models.generate_content(
-                    model=model_name,
-                    contents=[prompt_text, pil_image],
-                )
-                if index > 0:
-                    logger.warning("Vision OCR でモデルを %s にフォールバックしました。", model_name)
-                return response, model_name
-            except Exception as exc:
-                last_error = exc
-                logger.warning(
-                    "Vision OCR モデル %s の呼び出しに失敗しました: %s",
-                    model_name,
-                    sanitize_sensitive_data(str(exc)),
-                )
-                can_retry = (
-                    index < len(model_candidates) - 1
-                    and self.settings_manager.get_llm_mode() == "auto"
-                    and should_retry_with_fallback(exc)
-                )
-                if not can_retry:
-                    raise
-
-        if last_error is not None:
-            raise last_error
-        raise RuntimeError("利用可能なGoogle AIモデルが見つかりません。")
-
-    def extract_text(self, pixmap: QPixmap | QImage | bytes, lang: str = None) -> str:
-        """画像からテキストを抽出します。"""
+    def extract_text(
+        self,
+        pixmap: QPixmap | QImage | bytes,
+        lang: str = None,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> str:
+        """画像からテキストを抽出します。on_delta を渡すと生成途中のテキストを逐次通知します。"""
         if not self.is_available():
             return "エラー: Vision OCR サービスが利用できません。Google APIキーを確認してください。"
 
-        base64_image: str | None = None
+        image_data: bytes | None = None
 
         if isinstance(pixmap, (bytes, bytearray)):
             if not pixmap:
                 logger.error("有効な画像がありません。")
                 return ""
-            base64_image = base64.b64encode(pixmap).decode("utf-8")
+            image_data = bytes(pixmap)
         else:
             if pixmap.isNull():
                 logger.error("有効な画像がありません。")
                 return ""
 
         try:
-            timeout = self.settings_manager.get_timeout()
+            if image_data is None:
+                image_data = encode_capture_image(
+                    pixmap,
+                    self.settings_manager.get_image_format(),
+                    self.settings_manager.get_jpeg_quality(),
+                    self.settings_manager.get_image_max_side(),
+                )
 
-            if base64_image is None:
-                buffer = QBuffer()
-                buffer.open(QIODevice.ReadWrite)
-                pixmap.save(buffer, "PNG")
-                base64_image = base64.b64encode(buffer.data().data()).decode("utf-8")
-                buffer.close()
+            image_part = build_image_part(image_data, detect_image_mime_type(image_data))
 
-            image_data = base64.b64decode(base64_image)
-            pil_image = Image.open(BytesIO(image_data))
+            prompt_text = OCR_PROMPT + OCR_LANGUAGE_HINT.format(lang=lang) if lang else OCR_PROMPT
 
-            prompt_text = "画像内のテキストを改行を保ったまま抽出してください。OCR のみを行い、余計な説明は不要です。"
-            if lang:
-                prompt_text += f"テキストの言語は{lang}です。"
+            model_candidates = get_google_model_candidates(self.settings_manager)
+            model_chain = format_model_chain(model_candidates)
+            cache = get_persistent_cache() if self.settings_manager.get_persistent_cache_enabled() else None
+            cache_key = build_cache_key("vision_ocr", model_chain, lang or "", image_data)
+            if cache is not None:
+                cached_text = cache.get(cache_key)
+                if cached_text is not None:
+                    logger.info("Vision OCR の結果をキャッシュから再利用します（%s文字）", len(cached_text))
+                    return cached_text
 
-            logger.info(
-                "Google AI Vision OCR を実行します。モデル候補: %s",
-                format_model_chain(get_google_model_candidates(self.settings_manager)),
+            logger.info("Google AI Vision OCR を実行します。モデル候補: %s", model_chain)
+            client = create_google_client(
+                self.settings_manager.get_api_key("gemini") or "",
+                self.settings_manager.get_timeout(),
+            )
+            text, model_name = generate_with_model_fallback(
+                self.settings_manager,
+                client,
+                [prompt_text, image_part],
+                "Vision OCR",
+                model_candidates=model_candidates,
+                on_delta=on_delta,
             )
-            response, model_name = self._generate_with_model_fallback(prompt_text, pil_image, timeout)
-            extracted_text = (response.text or "").strip()
+            extracted_text = text.strip()
             logger.info("Google AI Vision OCR 処理が完了しました（%s文字, model=%s）", len(extracted_text), model_name)
+            if cache is not None and extracted_text:
+                cache.set(cache_key, extracted_text)
             return extracted_text
         except Exception as e:
             handle_exception(logger, e, "Google AI Vision OCR 処理")
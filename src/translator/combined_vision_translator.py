@@ -1,21 +1,22 @@
-import base64
+import json
 import logging
 import sys
-from io import BytesIO
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
-from PIL import Image
-from PyQt5.QtCore import QBuffer, QIODevice
 from PyQt5.QtGui import QImage, QPixmap
 
 from ..utils.google_ai import (
-    build_generation_config_for_model,
+    build_image_part,
     create_google_client,
     format_model_chain,
+    generate_with_model_fallback,
     get_google_model_candidates,
-    should_retry_with_fallback,
 )
+from ..utils.image_utils import detect_image_mime_type, encode_capture_image
 from ..utils.localization import get_language_name
+from ..utils.result_cache import build_cache_key, get_persistent_cache
 from ..utils.settings_manager import SettingsManager
 from ..utils.utils import handle_exception, sanitize_sensitive_data
 from .translator_service import TranslatorService
@@ -30,13 +31,61 @@ def _get_prompt_template_path() -> Path:
     return Path(__file__).resolve().parent.parent / "prompts" / "vision_translation_prompt.md"
 
 
+@lru_cache(maxsize=1)
+def _load_prompt_template() -> str:
+    """一括翻訳プロンプトのテンプレートを読み込む（プロセス内で一度だけ）。"""
+    try:
+        return _get_prompt_template_path().read_text(encoding="utf-8")
+    except OSError as exc:
+        logger.error("一括翻訳プロンプトの読み込みに失敗しました: %s", sanitize_sensitive_data(str(exc)))
+        raise RuntimeError("一括翻訳プロンプトを読み込めませんでした。") from exc
+
+
+# 原文も必要な場合に一括翻訳プロンプトの末尾へ追加する出力形式の指示
+SOURCE_JSON_INSTRUCTION = (
+    "\n\n## 出力形式\n\n"
+    "上記のルールに関わらず、次の形式の JSON オブジェクトのみを出力してください。\n"
+    '{"original": "画像内の文字列（改行を保ったまま）", "translation": "翻訳後の文字列"}\n'
+)
+
+
+@lru_cache(maxsize=16)
+def _build_prompt_text(target_language_name: str, include_source: bool = False) -> str:
+    """Markdown テンプレートから一括翻訳プロンプトを組み立てる。"""
+    prompt_text = _load_prompt_template().format(target_language_name=target_language_name)
+    return prompt_text + SOURCE_JSON_INSTRUCTION if include_source else prompt_text
+
+
+def split_source_and_translation(response: str) -> tuple[str, str] | None:
+    """
+    原文付きの一括翻訳結果（JSON）を (原文, 訳文) に分ける。
+    形式が崩れていて取り出せない場合は None を返す。
+    """
+    text = response.strip()
+    # モデルによっては ```json ... ``` で囲んで返すため、最初と最後の波括弧の間だけを読む
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end <= start:
+        return None
+    try:
+        # 原文の改行を文字列内にそのまま出力するモデルがあるため、制御文字を許容して読む
+        data = json.loads(text[start : end + 1], strict=False)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    original, translation = data.get("original"), data.get("translation")
+    if not isinstance(original, str) or not isinstance(translation, str) or not translation.strip():
+        return None
+    return original.strip(), translation.strip()
+
+
 class CombinedVisionTranslator(TranslatorService):
     """
     Google AI を使用して画像からテキストを抽出し、同時に翻訳するサービス。
     """
 
-    def __init__(self):
-        self.settings_manager = SettingsManager()
+    def __init__(self, settings_manager: SettingsManager | None = None):
+        self.settings_manager = settings_manager or SettingsManager()
         self.last_used_model: str | None = None
         logger.info("CombinedVisionTranslatorを初期化しました")
 
@@ -50,96 +99,81 @@ class CombinedVisionTranslator(TranslatorService):
             return False
         return True
 
-    def _generate_with_model_fallback(self, prompt_text: str, pil_image: Image.Image, timeout: int):
-        """Auto mode では一時的な障害時にフォールバックモデルへ切り替える。"""
-        model_candidates = get_google_model_candidates(self.settings_manager)
-        last_error: Exception | None = None
-        client = create_google_client(self.settings_manager.get_api_key("gemini") or "")
-
-        for index, model_name in enumerate(model_candidates):
-            try:
-                config = build_generation_config_for_model(model_name)
-                response = client.models.generate_content(
-                    model=model_name,
-                    contents=[prompt_text, pil_image],
-                    config=config,
-                )
-                if index > 0:
-                    logger.warning("Vision一括翻訳でモデルを %s にフォールバックしました。", model_name)
-                return response, model_name
-            except Exception as exc:
-                last_error = exc
-                logger.warning(
-                    "Vision一括翻訳モデル %s の呼び出しに失敗しました: %s",
-                    model_name,
-                    sanitize_sensitive_data(str(exc)),
-                )
-                can_retry = (
-                    index < len(model_candidates) - 1
-                    and self.settings_manager.get_llm_mode() == "auto"
-                    and should_retry_with_fallback(exc)
-                )
-                if not can_retry:
-                    raise
-
-        if last_error is not None:
-            raise last_error
-        raise RuntimeError("利用可能なGoogle AIモデルが見つかりません。")
-
-    def _build_prompt_text(self, target_language_name: str) -> str:
-        """Markdown テンプレートから一括翻訳プロンプトを読み込む。"""
-        try:
-            template = _get_prompt_template_path().read_text(encoding="utf-8")
-        except OSError as exc:
-            logger.error("一括翻訳プロンプトの読み込みに失敗しました: %s", sanitize_sensitive_data(str(exc)))
-            raise RuntimeError("一括翻訳プロンプトを読み込めませんでした。") from exc
-        return template.format(target_language_name=target_language_name)
-
-    def translate_image(self, pixmap: QPixmap | QImage | bytes, target_lang: str = None) -> str:
-        """画像からテキストを抽出し、指定された言語に翻訳します。"""
+    def translate_image(
+        self,
+        pixmap: QPixmap | QImage | bytes,
+        target_lang: str = None,
+        on_delta: Callable[[str], None] | None = None,
+        include_source: bool = False,
+    ) -> str:
+        """
+        画像からテキストを抽出し、指定された言語に翻訳します。on_delta を渡すと生成途中の訳文を逐次通知します。
+        include_source を指定すると原文と訳文を JSON で返します（split_source_and_translation で分解する）。
+        """
         if not self.is_available():
             return "エラー: 一括翻訳サービスが利用できません。Google APIキーを確認してください。"
 
         self.last_used_model = None
-        base64_image: str | None = None
 
         if isinstance(pixmap, (bytes, bytearray)):
             if not pixmap:
                 logger.error("有効な画像がありません。")
                 return ""
-            base64_image = base64.b64encode(pixmap).decode("utf-8")
-        else:
-            if pixmap.isNull():
-                logger.error("有効な画像がありません。")
-                return ""
+        elif pixmap.isNull():
+            logger.error("有効な画像がありません。")
+            return ""
 
         try:
-            timeout = self.settings_manager.get_timeout()
-
-            if base64_image is None:
-                buffer = QBuffer()
-                buffer.open(QIODevice.ReadWrite)
-                pixmap.save(buffer, "PNG")
-                base64_image = base64.b64encode(buffer.data().data()).decode("utf-8")
-                buffer.close()
-
-            image_data = base64.b64decode(base64_image)
-            pil_image = Image.open(BytesIO(image_data))
+            if isinstance(pixmap, (bytes, bytearray)):
+                image_data = pixmap
+            else:
+                image_data = encode_capture_image(
+                    pixmap,
+                    self.settings_manager.get_image_format(),
+                    self.settings_manager.get_jpeg_quality(),
+                    self.settings_manager.get_image_max_side(),
+                )
+            image_part = build_image_part(image_data, detect_image_mime_type(image_data))
 
             if not target_lang:
                 target_lang = self.settings_manager.get_app_language()
 
             target_language_name = get_language_name(target_lang)
-            prompt_text = self._build_prompt_text(target_language_name)
-
-            logger.info(
-                "Google AI Vision一括翻訳を実行します。モデル候補: %s",
-                format_model_chain(get_google_model_candidates(self.settings_manager)),
+            prompt_text = _build_prompt_text(target_language_name, include_source)
+
+            model_chain = format_model_chain(get_google_model_candidates(self.settings_manager))
+            cache = get_persistent_cache() if self.settings_manager.get_persistent_cache_enabled() else None
+            cache_kind = "vision_translation_with_source" if include_source else "vision_translation"
+            cache_key = build_cache_key(cache_kind, model_chain, target_lang, image_data)
+            if cache is not None:
+                cached_value = cache.get(cache_key)
+                if cached_value is not None:
+                    cached = json.loads(cached_value)
+                    self.last_used_model = cached.get("model")
+                    logger.info("Vision一括翻訳の結果をキャッシュから再利用します（%s文字）", len(cached["text"]))
+                    return cached["text"]
+
+            logger.info("Google AI Vision一括翻訳を実行します。モデル候補: %s", model_chain)
+            client = create_google_client(
+                self.settings_manager.get_api_key("gemini") or "",
+                self.settings_manager.get_timeout(),
+            )
+            generated_text, model_name = generate_with_model_fallback(
+                self.settings_manager,
+                client,
+                [prompt_text, image_part],
+                "Vision一括翻訳",
+                on_delta=on_delta,
             )
-            response, model_name = self._generate_with_model_fallback(prompt_text, pil_image, timeout)
-            translated_text = (response.text or "").strip()
+            translated_text = generated_text.strip()
             self.last_used_model = model_name
             logger.info("Google AI Vision 一括翻訳処理が完了しました（%s文字, model=%s）", len(translated_text), model_name)
+            # 形式の崩れた原文付きの結果は再利用しても使えないため保存しない
+            is_cacheable = bool(translated_text) and (
+                not include_source or split_source_and_translation(translated_text) is not None
+            )
+            if cache is not None and is_cacheable:
+                cache.set(cache_key, json.dumps({"text": translated_text, "model": model_name}, ensure_ascii=False))
             return translated_text
         except Exception as e:
             handle_exception(logger, e, "Google AI Vision 一括翻訳処理")
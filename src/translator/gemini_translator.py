@@ -1,70 +1,75 @@
 """
 Translator that uses the Google GenAI SDK.
 """
+import hashlib
 import logging
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Callable, Optional
 
 from ..utils.google_ai import (
     create_google_client,
     format_model_chain,
+    generate_with_model_fallback,
     get_google_model_candidates,
-    should_retry_with_fallback,
+    request_timeout_config,
 )
 from ..utils.localization import get_language_name
+from ..utils.result_cache import build_cache_key, get_persistent_cache
 from ..utils.settings_manager import SettingsManager
 from ..utils.utils import handle_exception, sanitize_sensitive_data
 from .translator_service import TranslatorService
 
 logger = logging.getLogger("ocr_translator")
 
+# 検証に成功したAPIキーを再検証せずに信頼する時間（秒）
+VERIFY_CACHE_TTL_SECONDS = 60
+# APIキー検証の応答を待つ最大時間（秒）
+VERIFY_TIMEOUT_SECONDS = 5
+
+TRANSLATION_PROMPT_TEMPLATE = (
+    "# 今から与えられる文字列を全て{target_language_name}に翻訳してください\n\n"
+    "## ルール\n\n"
+    "- 出力される文字は翻訳後の文字列のみになります。他の一切の文字が混入することは禁止されています\n\n"
+    "- 文章の意味の説明は不要です。翻訳後の文章をそのまま出力してください\n\n"
+    "- 固有名詞は無理に意訳せず音訳してください\n\n"
+    "- 入力文字が不明瞭で読めない場合は、推測せず不明瞭で読めないという文を{target_language_name}で出力してください。この時のみ例外的に翻訳後文章以外の出力が許可されます\n\n"
+    "## 例\n"
+    "出力先言語 : 日本語\n"
+    "入力文章 : Hello, how are you doing?\n"
+    "出力 : こんにちは、調子はどうですか？\n\n"
+    "出力先言語 : 英語\n"
+    "入力文章 : 今日は雨降るらしいから傘持っていった方がいいよ\n"
+    "出力 : It's supposed to rain today, so you should take an umbrella.\n\n"
+    "## 入力文章\n"
+)
+
+
+@lru_cache(maxsize=16)
+def _build_prompt_prefix(target_language_name: str) -> str:
+    """翻訳対象の文章の前に付ける指示部分を言語ごとに組み立てる。"""
+    return TRANSLATION_PROMPT_TEMPLATE.format(target_language_name=target_language_name)
+
 
 class GeminiTranslator(TranslatorService):
     """Google AI を利用した翻訳サービス."""
 
-    def __init__(self) -> None:
-        self.settings_manager = SettingsManager()
+    # 検証に成功したキーとモデルの組み合わせ（キーはハッシュ化して保持）-> 成功時刻
+    _verified_keys: dict[str, float] = {}
+
+    def __init__(self, settings_manager: SettingsManager | None = None) -> None:
+        self.settings_manager = settings_manager or SettingsManager()
         self._api_key: Optional[str] = None
+        self.last_used_model: Optional[str] = None
         logger.info("GeminiTranslatorを初期化しました")
 
     def _refresh_api_key(self) -> None:
         self._api_key = self.settings_manager.get_api_key("gemini")
 
-    def _generate_content_with_model_fallback(self, prompt: str, timeout: int):
-        """Auto mode では一時的な障害時にフォールバックモデルへ切り替える。"""
-        model_candidates = get_google_model_candidates(self.settings_manager)
-        last_error: Exception | None = None
-        client = create_google_client(self._api_key or "")
-
-        for index, model_name in enumerate(model_candidates):
-            try:
-                response = client.models.generate_content(
-                    model=model_name,
-                    contents=prompt,
-                )
-                if index > 0:
-                    logger.warning("Google AI モデルを %s にフォールバックしました。", model_name)
-                return response, model_name
-            except Exception as exc:
-                last_error = exc
-                logger.warning(
-                    "Google AI モデル %s の呼び出しに失敗しました: %s",
-                    model_name,
-                    sanitize_sensitive_data(str(exc)),
-                )
-                can_retry = (
-                    index < len(model_candidates) - 1
-                    and self.settings_manager.get_llm_mode() == "auto"
-                    and should_retry_with_fallback(exc)
-                )
-                if not can_retry:
-                    raise
-
-        if last_error is not None:
-            raise last_error
-        raise RuntimeError("利用可能なGoogle AIモデルが見つかりません。")
-
-    def translate(self, text, source_lang=None, target_lang=None):
+    def translate(self, text, source_lang=None, target_lang=None, on_delta: Callable[[str], None] | None = None):
+        """テキストを翻訳します。on_delta を渡すと生成途中の訳文を逐次通知します。"""
         self._refresh_api_key()
+        self.last_used_model = None
 
         if not text:
             logger.warning("翻訳するテキストがありません")
@@ -80,36 +85,35 @@ class GeminiTranslator(TranslatorService):
 
             target_language_name = get_language_name(target_lang)
 
-            prompt = (
-                f"# 今から与えられる文字列を全て{target_language_name}に翻訳してください\n\n"
-                "## ルール\n\n"
-                "- 出力される文字は翻訳後の文字列のみになります。他の一切の文字が混入することは禁止されています\n\n"
-                "- 文章の意味の説明は不要です。翻訳後の文章をそのまま出力してください\n\n"
-                "- 固有名詞は無理に意訳せず音訳してください\n\n"
-                f"- 入力文字が不明瞭で読めない場合は、推測せず不明瞭で読めないという文を{target_language_name}で出力してください。この時のみ例外的に翻訳後文章以外の出力が許可されます\n\n"
-                "## 例\n"
-                "出力先言語 : 日本語\n"
-                "入力文章 : Hello, how are you doing?\n"
-                "出力 : こんにちは、調子はどうですか？\n\n"
-                "出力先言語 : 英語\n"
-                "入力文章 : 今日は雨降るらしいから傘持っていった方がいいよ\n"
-                "出力 : It's supposed to rain today, so you should take an umbrella.\n\n"
-                "## 入力文章\n"
-                f"{text}"
-            )
+            prompt = _build_prompt_prefix(target_language_name) + text
+
+            model_chain = format_model_chain(get_google_model_candidates(self.settings_manager))
+            cache = get_persistent_cache() if self.settings_manager.get_persistent_cache_enabled() else None
+            cache_key = build_cache_key("text_translation", model_chain, target_lang, text)
+            if cache is not None:
+                cached_text = cache.get(cache_key)
+                if cached_text is not None:
+                    logger.info("翻訳結果をキャッシュから再利用します（%s文字）", len(cached_text))
+                    return cached_text
 
             logger.info(
                 "Google AIによる翻訳を実行します（対象言語: %s, モデル候補: %s）",
                 target_language_name,
-                format_model_chain(get_google_model_candidates(self.settings_manager)),
+                model_chain,
             )
 
-            response, model_name = self._generate_content_with_model_fallback(
+            generated_text, model_name = generate_with_model_fallback(
+                self.settings_manager,
+                create_google_client(self._api_key or "", self.settings_manager.get_timeout()),
                 prompt,
-                self.settings_manager.get_timeout(),
+                "Google AI 翻訳",
+                on_delta=on_delta,
             )
-            translated_text = (response.text or "").strip()
+            translated_text = generated_text.strip()
+            self.last_used_model = model_name
             logger.info("翻訳が完了しました。使用モデル: %s", model_name)
+            if cache is not None and translated_text:
+                cache.set(cache_key, translated_text)
             return translated_text
 
         except Exception as exc:
@@ -120,15 +124,25 @@ class GeminiTranslator(TranslatorService):
         self._refresh_api_key()
         return bool(self._api_key)
 
-    def verify_api_key(self, api_key):
+    def verify_api_key(self, api_key, model_name: Optional[str] = None):
+        """APIキーを検証する。model_name を省略すると設定中の先頭候補モデルで確認する。"""
         if not api_key:
             return False, "APIキーが入力されていません。"
 
+        model_name = model_name or self.settings_manager.get_model_candidates()[0]
+        cache_key = hashlib.sha256(f"{model_name}\0{api_key}".encode("utf-8")).hexdigest()
+        verified_at = self._verified_keys.get(cache_key)
+        if verified_at is not None and time.monotonic() - verified_at < VERIFY_CACHE_TTL_SECONDS:
+            logger.info("Google APIキーは直前に検証済みのため、再検証を省略します。")
+            return True, ""
+
         try:
             client = create_google_client(api_key)
-            model_name = self.settings_manager.get_model_candidates()[0]
-            client.models.generate_content(model=model_name, contents="test")
+            # 生成は行わず、モデル情報の取得でキーとモデル名の有効性だけを確認する。
+            # 設定画面を長く止めないよう、翻訳用より短いタイムアウトで打ち切る
+            client.models.get(model=model_name, config=request_timeout_config(VERIFY_TIMEOUT_SECONDS))
             logger.info("Google APIキーの検証に成功しました。")
+            self._verified_keys[cache_key] = time.monotonic()
             return True, ""
         except Exception as exc:
             safe_exc = sanitize_sensitive_data(str(exc))
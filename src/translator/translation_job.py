@@ -4,15 +4,27 @@ Background translation job helpers isolated from the Qt UI process.
 from __future__ import annotations
 
 import logging
+from typing import Callable
 
 from ..ocr.vision_ocr_service import VisionOCRService
+from ..utils.settings_manager import SettingsManager
+from .combined_vision_translator import split_source_and_translation
 from .translation_manager import TranslationManager
 
 logger = logging.getLogger("ocr_translator")
 
 
-def run_translation_job(image_bytes: bytes, target_lang: str, transcribe_original: bool) -> dict:
-    """Run OCR / translation and return a serializable result payload."""
+def run_translation_job(
+    image_bytes: bytes,
+    target_lang: str,
+    transcribe_original: bool,
+    on_delta: Callable[[str, str], None] | None = None,
+) -> dict:
+    """
+    Run OCR / translation and return a serializable result payload.
+
+    on_delta receives (result field name, text chunk) while output is being generated.
+    """
     logger.info("バックグラウンド翻訳ジョブを実行します。")
     result = {
         "translated_text": None,
@@ -21,21 +33,42 @@ def run_translation_job(image_bytes: bytes, target_lang: str, transcribe_origina
         "last_used_model": None,
     }
 
+    translation_delta = (lambda text: on_delta("translated_text", text)) if on_delta else None
+
     try:
+        settings_manager = SettingsManager()
+        translation_manager = TranslationManager(settings_manager)
+        combined = None
         if transcribe_original:
-            ocr_service = VisionOCRService()
-            translation_manager = TranslationManager()
-            extracted_text = ocr_service.extract_text(image_bytes)
+            # まず原文と訳文を1回の呼び出しでまとめて取得し、形式が崩れた場合のみ OCR と翻訳を個別に行う
+            response = translation_manager.translate_image(image_bytes, target_lang, include_source=True)
+            if response and response.startswith("エラー:"):
+                result["translated_text"] = response
+                return result
+            combined = split_source_and_translation(response or "")
+            if combined is None:
+                logger.warning("原文付き一括翻訳の結果を解釈できなかったため、OCR と翻訳を個別に実行します。")
+
+        if combined is not None:
+            result["extracted_text"], result["translated_text"] = combined
+            result["last_used_model"] = translation_manager.get_last_used_image_model()
+        elif transcribe_original:
+            ocr_service = VisionOCRService(settings_manager)
+            ocr_delta = (lambda text: on_delta("extracted_text", text)) if on_delta else None
+            extracted_text = ocr_service.extract_text(image_bytes, on_delta=ocr_delta)
             if extracted_text and not extracted_text.startswith("エラー:"):
                 result["extracted_text"] = extracted_text
-                translated_text = translation_manager.translate(extracted_text, target_lang=target_lang)
+                translated_text = translation_manager.translate(
+                    extracted_text,
+                    target_lang=target_lang,
+                    on_delta=translation_delta,
+                )
                 result["translated_text"] = translated_text
-                result["last_used_model"] = translation_manager.get_last_used_image_model()
+                result["last_used_model"] = translation_manager.get_last_used_text_model()
             else:
                 result["error_message"] = extracted_text or "テキストの抽出に失敗しました。"
         else:
-            translation_manager = TranslationManager()
-            translated_text = translation_manager.translate_image(image_bytes, target_lang)
+            translated_text = translation_manager.translate_image(image_bytes, target_lang, on_delta=translation_delta)
             result["translated_text"] = translated_text
             result["last_used_model"] = translation_manager.get_last_used_image_model()
     except Exception as exc:
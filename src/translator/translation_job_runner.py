@@ -3,22 +3,76 @@ CLI entrypoint for isolated translation subprocess execution.
 """
 from __future__ import annotations
 
-import base64
 import json
+import logging
 import sys
+import threading
 
 from .translation_job import run_translation_job
 
+logger = logging.getLogger("ocr_translator")
+
+
+def _write_event(event: dict) -> None:
+    """Write one JSON event per line so the UI can consume output incrementally."""
+    sys.stdout.buffer.write(json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _warm_up() -> None:
+    """
+    Load the GenAI SDK and open a connection while the UI is still waiting for the capture.
+
+    The UI starts this process as soon as region selection begins, so the import and the
+    TLS handshake overlap with the user's drag instead of delaying the first request.
+    """
+    try:
+        from ..utils.google_ai import create_google_client
+        from ..utils.settings_manager import SettingsManager
+
+        settings_manager = SettingsManager()
+        api_key = settings_manager.get_api_key("gemini")
+        if not api_key:
+            return
+        # ジョブ側と同じ (キー, タイムアウト) で作り、キャッシュされたクライアントを使い回させる
+        client = create_google_client(api_key, settings_manager.get_timeout())
+        client.models.get(model=settings_manager.get_model_candidates()[0])
+    except Exception as exc:
+        logger.debug("翻訳サブプロセスの事前準備に失敗しました: %s", exc)
+
+
+def _read_payload() -> tuple[dict, bytes] | None:
+    """
+    Read the JSON header line followed by ``image_size`` raw image bytes from stdin.
+
+    Returns None when stdin is closed before a request arrives (the capture was discarded).
+    """
+    stdin = sys.stdin.buffer
+    header = stdin.readline()
+    if not header.strip():
+        return None
+    payload = json.loads(header)
+    image_size = int(payload["image_size"])
+    image_bytes = stdin.read(image_size)
+    if len(image_bytes) != image_size:
+        raise ValueError(f"画像データが途中で途切れました ({len(image_bytes)}/{image_size} bytes)")
+    return payload, image_bytes
+
 
 def main() -> int:
-    payload = json.load(sys.stdin)
-    image_bytes = base64.b64decode(payload["image_bytes_b64"])
+    threading.Thread(target=_warm_up, name="translation-warm-up", daemon=True).start()
+    request = _read_payload()
+    if request is None:
+        return 0
+    payload, image_bytes = request
     target_lang = payload.get("target_lang")
     transcribe_original = bool(payload.get("transcribe_original"))
-    result = run_translation_job(image_bytes, target_lang, transcribe_original)
-    output = json.dumps(result, ensure_ascii=False).encode("utf-8")
-    sys.stdout.buffer.write(output)
-    sys.stdout.buffer.flush()
+
+    def on_delta(field: str, text: str) -> None:
+        _write_event({"event": "delta", "field": field, "text": text})
+
+    result = run_translation_job(image_bytes, target_lang, transcribe_original, on_delta=on_delta)
+    _write_event({"event": "result", "result": result})
     return 0
 
 
@@ -2,12 +2,12 @@
 翻訳マネージャーモジュール
 """
 import logging
+from functools import cached_property
+from typing import Callable
 
 from PyQt5.QtGui import QImage, QPixmap
 
 from ..utils.settings_manager import SettingsManager
-from .combined_vision_translator import CombinedVisionTranslator
-from .gemini_translator import GeminiTranslator
 
 logger = logging.getLogger("ocr_translator")
 
@@ -15,34 +15,59 @@ logger = logging.getLogger("ocr_translator")
 class TranslationManager:
     """翻訳サービスを管理するクラス"""
 
-    def __init__(self):
-        self.settings_manager = SettingsManager()
-        self.gemini_translator = GeminiTranslator()
-        self.combined_vision_translator = CombinedVisionTranslator()
+    def __init__(self, settings_manager: SettingsManager | None = None):
+        # 設定は各翻訳サービスで共有し、設定ファイルの読み込みを一度で済ませる
+        self.settings_manager = settings_manager or SettingsManager()
         logger.info("TranslationManagerを初期化しました")
 
-    def translate(self, text, source_lang=None, target_lang=None):
-        """テキストを翻訳する"""
+    # 各翻訳サービスは初めて使うときに生成し、使わない経路のモジュール読み込みを省く
+    @cached_property
+    def gemini_translator(self):
+        from .gemini_translator import GeminiTranslator
+
+        return GeminiTranslator(self.settings_manager)
+
+    @cached_property
+    def combined_vision_translator(self):
+        from .combined_vision_translator import CombinedVisionTranslator
+
+        return CombinedVisionTranslator(self.settings_manager)
+
+    def translate(self, text, source_lang=None, target_lang=None, on_delta: Callable[[str], None] | None = None):
+        """テキストを翻訳する。on_delta には生成途中の訳文が逐次渡される"""
         if not text:
             logger.warning("翻訳するテキストがありません")
             return ""
 
         if self.gemini_translator.is_available():
-            return self.gemini_translator.translate(text, source_lang, target_lang)
+            return self.gemini_translator.translate(text, source_lang, target_lang, on_delta=on_delta)
         return "エラー: Google APIキーが設定されていません。設定画面でAPIキーを設定してください。"
 
-    def translate_image(self, pixmap: QPixmap | QImage | bytes, target_lang: str = None) -> str:
+    def translate_image(
+        self,
+        pixmap: QPixmap | QImage | bytes,
+        target_lang: str = None,
+        on_delta: Callable[[str], None] | None = None,
+        include_source: bool = False,
+    ) -> str:
         """
         画像からテキストを抽出し、指定された言語に翻訳します（一括処理）。
+        include_source を指定すると原文と訳文を JSON で返します。
         """
         if not self.combined_vision_translator.is_available():
             return "エラー: 一括翻訳サービスが利用できません。APIキーを確認してください。"
 
-        return self.combined_vision_translator.translate_image(pixmap, target_lang)
+        return self.combined_vision_translator.translate_image(
+            pixmap,
+            target_lang,
+            on_delta=on_delta,
+            include_source=include_source,
+        )
 
     def is_any_api_available(self):
         """APIが利用可能かどうかを確認する"""
-        return self.gemini_translator.is_available() or self.combined_vision_translator.is_available()
+        # どちらのサービスも同じ Google APIキーを使うため、インスタンスを作らずに設定だけを確認する
+        return bool(self.settings_manager.get_api_key("gemini"))
 
     def get_translator_service(self, api_type):
         """指定されたAPIタイプの翻訳サービスインスタンスを返す"""
@@ -54,3 +79,7 @@ class TranslationManager:
     def get_last_used_image_model(self) -> str | None:
         """直近の一括翻訳で使用したモデル名を返す。"""
         return self.combined_vision_translator.get_last_used_model()
+
+    def get_last_used_text_model(self) -> str | None:
+        """直近のテキスト翻訳で使用したモデル名を返す（キャッシュから返した場合は None）。"""
+        return self.gemini_translator.last_used_model
@@ -7,12 +7,12 @@ import logging
 import subprocess
 import threading
 import sys
-import base64
+from functools import lru_cache, partial
 from pathlib import Path
 from ctypes import wintypes
 
-from PyQt5.QtCore import QBuffer, QIODevice, QObject, QRect, QSize, Qt, pyqtSignal
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import QObject, QRect, QSize, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QPixmap, QTextCursor
 from PyQt5.QtWidgets import (
     QAction,
     QApplication,
@@ -32,7 +32,9 @@ from PyQt5.QtWidgets import (
 
 from ..ui.screen_capture import ScreenCaptureWindow
 from ..ui.settings_dialog import SettingsDialog
+from ..utils.image_utils import encode_capture_image, is_blank_capture
 from ..utils.localization import get_ui_string
+from ..utils.result_cache import LRUCache, clear_persistent_cache, image_digest
 from ..utils.settings_manager import SettingsManager
 from ..utils.utils import sanitize_sensitive_data
 
@@ -42,11 +44,81 @@ MOD_CONTROL = 0x0002
 MOD_SHIFT = 0x0004
 VK_X = 0x58
 WM_HOTKEY = 0x0312
+RESULT_CACHE_SIZE = 32
+# 原文表示ありの翻訳で連続して行われうる API 呼び出しの最大数
+# （原文付き一括翻訳 → 解釈できない場合の OCR → テキスト翻訳）
+TRANSCRIBE_MAX_API_CALLS = 3
+# サブプロセスの起動や SDK の読み込みに見込む時間（秒）
+WORKER_OVERHEAD_SECONDS = 30
+
+# スタイルシートはモジュール定数にして、ウィンドウを作るたびに文字列を組み立て直さない
+MAIN_WINDOW_STYLESHEET = """
+QMainWindow {
+    background-color: #f0f0f0;
+}
+QLabel {
+    font-family: "Yu Gothic UI", "Meiryo UI", sans-serif;
+    font-size: 14px;
+    color: #333333;
+}
+QPushButton {
+    font-family: "Yu Gothic UI", "Meiryo UI", sans-serif;
+    font-size: 14px;
+    background-color: #4CAF50;
+    color: white;
+    border-radius: 5px;
+    padding: 10px 20px;
+}
+QPushButton:hover {
+    background-color: #45a049;
+}
+QTextEdit {
+    font-family: "Yu Gothic UI", "Meiryo UI", monospace;
+    font-size: 14px;
+    border: 1px solid #cccccc;
+    border-radius: 5px;
+    padding: 5px;
+    background-color: white;
+}
+QStatusBar {
+    background-color: #e0e0e0;
+    color: #333333;
+}
+"""
+
+PROCESSING_PANEL_STYLESHEET = """
+QFrame#processingPanel {
+    background-color: rgba(17, 25, 40, 245);
+    border: 1px solid #4f8cff;
+    border-radius: 18px;
+}
+QLabel {
+    color: #f8fbff;
+    background-color: transparent;
+}
+QProgressBar {
+    border: 1px solid #4f8cff;
+    border-radius: 8px;
+    background: #142033;
+    min-height: 16px;
+}
+QProgressBar::chunk {
+    border-radius: 8px;
+    background-color: #66b3ff;
+}
+"""
+
+
+@lru_cache(maxsize=None)
+def _icon(path: str) -> QIcon:
+    """アイコンをパスごとに一度だけ読み込んで使い回す（QApplication 生成後に呼ぶこと）。"""
+    return QIcon(path)
 
 
 class TranslationResultBridge(QObject):
     """ワーカースレッドからメインスレッドへ結果を返す。"""
     result_ready = pyqtSignal(dict)
+    delta_ready = pyqtSignal(str, str)
 
 
 class ProcessingOverlay(QWidget):
@@ -59,29 +131,7 @@ class ProcessingOverlay(QWidget):
 
         panel = QFrame(self)
         panel.setObjectName("processingPanel")
-        panel.setStyleSheet(
-            """
-            QFrame#processingPanel {
-                background-color: rgba(17, 25, 40, 245);
-                border: 1px solid #4f8cff;
-                border-radius: 18px;
-            }
-            QLabel {
-                color: #f8fbff;
-                background-color: transparent;
-            }
-            QProgressBar {
-                border: 1px solid #4f8cff;
-                border-radius: 8px;
-                background: #142033;
-                min-height: 16px;
-            }
-            QProgressBar::chunk {
-                border-radius: 8px;
-                background-color: #66b3ff;
-            }
-            """
-        )
+        panel.setStyleSheet(PROCESSING_PANEL_STYLESHEET)
 
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(28, 24, 28, 24)
@@ -123,14 +173,26 @@ class MainWindow(QMainWindow):
         self.hotkey_id = 1
         self.settings_manager = SettingsManager()
         self.capture_window = None
+        self._capture_pending = False
         self.captured_pixmap = None
         self.extracted_text = ""
         self.translated_text = ""
+        self._clipboard = QApplication.clipboard()
         self.overlay = None
         self._last_capture_global_rect: QRect | None = None
         self.worker_thread: threading.Thread | None = None
+        self._standby_process: subprocess.Popen | None = None
+        self._standby_lock = threading.Lock()
+        self._result_cache = LRUCache(RESULT_CACHE_SIZE)
+        self._result_cache_lock = threading.Lock()
+        self._pending_cache_key: tuple | None = None
+        self._streaming_fields: set[str] = set()
         self.result_bridge = TranslationResultBridge()
         self.result_bridge.result_ready.connect(self._handle_translation_result)
+        self.result_bridge.delta_ready.connect(self._handle_translation_delta)
+        if not self.settings_manager.get_persistent_cache_enabled():
+            # 無効化されているのに前回までの翻訳結果がディスクに残らないよう削除しておく
+            clear_persistent_cache()
 
         self._init_ui()
         self._register_global_hotkey()
@@ -142,41 +204,7 @@ class MainWindow(QMainWindow):
     def _init_ui(self):
         """UIの初期化"""
         self.setMinimumSize(800, 600)
-        self.setStyleSheet(
-            """
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QLabel {
-                font-family: "Yu Gothic UI", "Meiryo UI", sans-serif;
-                font-size: 14px;
-                color: #333333;
-            }
-            QPushButton {
-                font-family: "Yu Gothic UI", "Meiryo UI", sans-serif;
-                font-size: 14px;
-                background-color: #4CAF50;
-                color: white;
-                border-radius: 5px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QTextEdit {
-                font-family: "Yu Gothic UI", "Meiryo UI", monospace;
-                font-size: 14px;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                padding: 5px;
-                background-color: white;
-            }
-            QStatusBar {
-                background-color: #e0e0e0;
-                color: #333333;
-            }
-            """
-        )
+        self.setStyleSheet(MAIN_WINDOW_STYLESHEET)
 
         self._create_menu_bar()
 
@@ -187,7 +215,7 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
 
-        self.capture_button = QPushButton(QIcon("icons/capture.png"), "")
+        self.capture_button = QPushButton(_icon("icons/capture.png"), "")
         self.capture_button.setIconSize(QSize(24, 24))
         self.capture_button.setMinimumHeight(40)
         self.capture_button.clicked.connect(self._on_capture_button_clicked)
@@ -211,10 +239,14 @@ class MainWindow(QMainWindow):
         self.original_text_edit = QTextEdit()
         self.original_text_edit.setReadOnly(True)
         self.original_text_edit.setAcceptRichText(False)
+        # 読み取り専用で逐次追記するため、追記ごとに溜まる取り消し履歴を持たない
+        self.original_text_edit.setUndoRedoEnabled(False)
         original_layout.addWidget(self.original_text_edit)
 
         self.copy_original_button = QPushButton()
-        self.copy_original_button.clicked.connect(self._copy_original_text)
+        self.copy_original_button.clicked.connect(
+            partial(self._copy_result_text, "extracted_text", "status_copy_original")
+        )
         original_layout.addWidget(self.copy_original_button)
 
         result_layout.addWidget(self.original_widget)
@@ -226,10 +258,13 @@ class MainWindow(QMainWindow):
         self.translation_text_edit = QTextEdit()
         self.translation_text_edit.setReadOnly(True)
         self.translation_text_edit.setAcceptRichText(False)
+        self.translation_text_edit.setUndoRedoEnabled(False)
         translation_layout.addWidget(self.translation_text_edit)
 
         self.copy_translation_button = QPushButton()
-        self.copy_translation_button.clicked.connect(self._copy_translation_text)
+        self.copy_translation_button.clicked.connect(
+            partial(self._copy_result_text, "translated_text", "status_copy_translation")
+        )
         translation_layout.addWidget(self.copy_translation_button)
 
         result_layout.addLayout(translation_layout)
@@ -283,56 +318,73 @@ class MainWindow(QMainWindow):
         menu_bar = self.menuBar()
 
         self.file_menu = menu_bar.addMenu("")
-        self.exit_action = QAction(QIcon("icons/exit.png"), "", self)
+        self.exit_action = QAction(_icon("icons/exit.png"), "", self)
         self.exit_action.triggered.connect(self.close)
         self.file_menu.addAction(self.exit_action)
 
         self.settings_menu = menu_bar.addMenu("")
-        self.settings_action = QAction(QIcon("icons/settings.png"), "", self)
+        self.settings_action = QAction(_icon("icons/settings.png"), "", self)
         self.settings_action.triggered.connect(self._show_settings_dialog)
         self.settings_menu.addAction(self.settings_action)
 
         self.help_menu = menu_bar.addMenu("")
-        self.about_action = QAction(QIcon("icons/info.png"), "", self)
+        self.about_action = QAction(_icon("icons/info.png"), "", self)
         self.about_action.triggered.connect(self._show_about_dialog)
         self.help_menu.addAction(self.about_action)
 
-        self.usage_action = QAction(QIcon("icons/help.png"), "", self)
+        self.usage_action = QAction(_icon("icons/help.png"), "", self)
         self.usage_action.triggered.connect(self._show_usage_dialog)
         self.help_menu.addAction(self.usage_action)
 
     def start_capture(self):
         """領域選択キャプチャを開始する。"""
-        if self.capture_window and self.capture_window.isVisible():
+        if self._capture_pending or (self.capture_window and self.capture_window.isVisible()):
+            return
+        # 翻訳の完了前に次のキャプチャを受け付けると API 呼び出しが重複するため無視する
+        if self.worker_thread is not None:
+            logger.info("翻訳処理中のためキャプチャ要求を無視しました。")
             return
 
         logger.info("領域選択キャプチャを開始します。")
         self.status_bar.showMessage(self.tr_ui("status_select_area"))
         self.hide()
-        QApplication.processEvents()
+        self._prepare_standby_subprocess()
+        # イベントループに戻ってメインウィンドウが消えてから画面を撮影する
+        self._capture_pending = True
+        QTimer.singleShot(0, self._open_capture_window)
 
+    def _open_capture_window(self):
+        self._capture_pending = False
         self.capture_window = ScreenCaptureWindow()
         self.capture_window.region_selected.connect(self._on_capture_complete)
-        self.capture_window.destroyed.connect(self.show)
+        # 破棄時の destroyed ではなく、閉じた時点の通知をイベントループ経由で受け取る
+        self.capture_window.capture_finished.connect(self._on_capture_window_closed, Qt.QueuedConnection)
         self.capture_window.show()
 
+    def _on_capture_window_closed(self):
+        """キャプチャウィンドウが閉じられたら破棄し、メインウィンドウを再表示する。"""
+        if self.capture_window is not None and not self.capture_window.isVisible():
+            self.capture_window.deleteLater()
+            self.capture_window = None
+        if not self._capture_pending:
+            self.show()
+
     def _on_capture_button_clicked(self):
         self.start_capture()
 
-    def _on_capture_complete(self, pixmap: QPixmap):
+    def _on_capture_complete(self, pixmap: QPixmap, capture_rect: QRect):
+        # 選択範囲はシグナルで受け取るため、閉じたキャプチャウィンドウはすぐに破棄してスクリーンショットを解放する
+        if self.capture_window is not None:
+            self.capture_window.deleteLater()
+            self.capture_window = None
+
         if not pixmap or pixmap.isNull():
             logger.info("キャプチャがキャンセルまたは失敗しました。")
             self.status_bar.showMessage(self.tr_ui("status_capture_cancelled"), 3000)
             self.show()
             return
 
-        try:
-            capture_rect = self.capture_window.rubber_band.geometry()
-            window_geo = self.capture_window.geometry()
-            self._last_capture_global_rect = capture_rect.translated(window_geo.topLeft())
-        except Exception as exc:
-            logger.warning("キャプチャ矩形の保存に失敗: %s", sanitize_sensitive_data(str(exc)))
-            self._last_capture_global_rect = None
+        self._last_capture_global_rect = QRect(capture_rect)
 
         self.captured_pixmap = pixmap
         self.show()
@@ -343,74 +395,223 @@ class MainWindow(QMainWindow):
         target_lang = self.settings_manager.get_app_language()
         transcribe_original = self.settings_manager.get_transcribe_original_text()
         self._update_ui_visibility()
-        self._start_translation_worker(pixmap, target_lang, transcribe_original)
-
-    def _pixmap_to_png_bytes(self, pixmap: QPixmap) -> bytes:
-        qbuffer = QBuffer()
-        qbuffer.open(QIODevice.ReadWrite)
-        try:
-            pixmap.save(qbuffer, "PNG")
-            return bytes(qbuffer.data())
-        finally:
-            qbuffer.close()
-
-    def _start_translation_worker(self, pixmap: QPixmap, target_lang: str, transcribe_original: bool):
-        image_bytes = self._pixmap_to_png_bytes(pixmap)
+        # QPixmap はGUIスレッド専用のため、ワーカースレッドにはスレッドセーフな QImage を渡す
+        self._start_translation_worker(pixmap.toImage(), target_lang, transcribe_original)
+
+    def _start_translation_worker(self, image: QImage, target_lang: str, transcribe_original: bool):
+        model_candidates = tuple(self.settings_manager.get_model_candidates())
+        encode_options = (
+            self.settings_manager.get_image_format(),
+            self.settings_manager.get_jpeg_quality(),
+            self.settings_manager.get_image_max_side(),
+        )
+        # 設定はGUIスレッドでだけ読み、ワーカースレッドには値として渡す
+        timeout = self.settings_manager.get_timeout()
+        self._pending_cache_key = None
+        self._streaming_fields.clear()
         self._set_processing_state(True)
         logger.info("バックグラウンド翻訳サブプロセスを開始します。")
 
         self.worker_thread = threading.Thread(
-            target=self._run_translation_subprocess,
-            args=(image_bytes, target_lang, transcribe_original),
+            target=self._run_translation_worker,
+            args=(image, target_lang, transcribe_original, model_candidates, encode_options, timeout),
             name="translation-worker",
             daemon=True,
         )
         self.worker_thread.start()
 
+    def _run_translation_worker(
+        self,
+        image: QImage,
+        target_lang: str,
+        transcribe_original: bool,
+        model_candidates: tuple[str, ...],
+        encode_options: tuple[str, int, int],
+        timeout: int,
+    ):
+        """ワーカースレッドで画像をエンコードし、キャッシュになければサブプロセスで翻訳する。"""
+        try:
+            is_blank = is_blank_capture(image)
+        except Exception as exc:
+            # 判定に失敗しても結果が返らず処理中のまま固まらないよう、通常どおり翻訳へ進む
+            logger.warning("空白キャプチャの判定に失敗しました: %s", exc)
+            is_blank = False
+        if is_blank:
+            logger.info("キャプチャ範囲に文字が見当たらないため、翻訳をスキップします。")
+            result = self._build_error_result(None)
+            result["no_text_detected"] = True
+            self.result_bridge.result_ready.emit(result)
+            return
+
+        try:
+            image_bytes = encode_capture_image(image, *encode_options)
+        except Exception as exc:
+            self.result_bridge.result_ready.emit(self._build_error_result(f"画像のエンコードに失敗しました: {exc}"))
+            return
+
+        cache_key = (image_digest(image_bytes), target_lang, transcribe_original, model_candidates)
+        with self._result_cache_lock:
+            cached_result = self._result_cache.get(cache_key)
+        if cached_result is not None:
+            logger.info("同一キャプチャの翻訳結果をキャッシュから再利用します。")
+            self.result_bridge.result_ready.emit(dict(cached_result))
+            return
+
+        self._pending_cache_key = cache_key
+        self._run_translation_subprocess(image_bytes, target_lang, transcribe_original, timeout)
+
     def _build_translation_subprocess_command(self) -> list[str]:
         if getattr(sys, "frozen", False):
             return [sys.executable, "--translation-worker"]
         return [sys.executable, "-m", "src.translator.translation_job_runner"]
 
-    def _run_translation_subprocess(self, image_bytes: bytes, target_lang: str, transcribe_original: bool):
+    def _run_translation_subprocess(
+        self,
+        image_bytes: bytes,
+        target_lang: str,
+        transcribe_original: bool,
+        timeout: int,
+    ):
         payload = {
-            "image_bytes_b64": base64.b64encode(image_bytes).decode("ascii"),
+            "image_size": len(image_bytes),
             "target_lang": target_lang,
             "transcribe_original": transcribe_original,
         }
-        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        # 各 API 呼び出しにタイムアウトが個別に適用されるため、呼び出し回数分の時間を待つ
+        api_calls = TRANSCRIBE_MAX_API_CALLS if transcribe_original else 1
+        time_limit = timeout * api_calls + WORKER_OVERHEAD_SECONDS
 
         try:
-            completed = subprocess.run(
-                self._build_translation_subprocess_command(),
-                input=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
-                capture_output=True,
-                cwd=str(self._get_project_root()),
-                creationflags=creationflags,
-                timeout=self.settings_manager.get_timeout() + 30,
-            )
-            stdout_text = (completed.stdout or b"").decode("utf-8", errors="replace")
-            stderr_text = (completed.stderr or b"").decode("utf-8", errors="replace")
-            if completed.returncode == 0:
-                result = json.loads(stdout_text or "{}")
-            else:
-                stderr = (stderr_text or stdout_text).strip()
-                result = {
-                    "translated_text": None,
-                    "extracted_text": "",
-                    "error_message": f"翻訳サブプロセスが異常終了しました。(code={completed.returncode}) {stderr[-400:]}".strip(),
-                    "last_used_model": None,
-                }
+            result = self._communicate_with_translation_subprocess(payload, image_bytes, time_limit)
         except Exception as exc:
-            result = {
-                "translated_text": None,
-                "extracted_text": "",
-                "error_message": f"翻訳サブプロセスの起動に失敗しました: {exc}",
-                "last_used_model": None,
-            }
+            result = self._build_error_result(f"翻訳サブプロセスの起動に失敗しました: {exc}")
 
         self.result_bridge.result_ready.emit(result)
 
+    def _communicate_with_translation_subprocess(self, payload: dict, image_bytes: bytes, time_limit: float) -> dict:
+        """
+        JSON のヘッダー行と画像の生バイト列をサブプロセスに渡し、
+        出力を1行ずつ読んで途中経過を転送しながら最終結果を返す。
+        time_limit 秒を過ぎても終わらない場合はサブプロセスを強制終了する。
+        """
+        process = self._take_standby_subprocess() or self._spawn_translation_subprocess()
+
+        # stderr のパイプが詰まってサブプロセスが止まらないよう別スレッドで読み切る
+        stderr_chunks: list[bytes] = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()),
+            name="translation-worker-stderr",
+            daemon=True,
+        )
+        stderr_reader.start()
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(time_limit, kill_on_timeout)
+        watchdog.start()
+
+        result = None
+        try:
+            process.stdin.write(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+            process.stdin.write(image_bytes)
+            process.stdin.close()
+            for line in process.stdout:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get("event") == "delta":
+                    self.result_bridge.delta_ready.emit(event.get("field", ""), event.get("text", ""))
+                elif event.get("event") == "result":
+                    result = event.get("result")
+            returncode = process.wait()
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                process.kill()
+        stderr_reader.join(timeout=1)
+
+        if timed_out.is_set():
+            return self._build_error_result("翻訳サブプロセスがタイムアウトしました。")
+        if returncode == 0 and isinstance(result, dict):
+            return result
+        stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace").strip()
+        return self._build_error_result(
+            f"翻訳サブプロセスが異常終了しました。(code={returncode}) {stderr[-400:]}".strip()
+        )
+
+    def _spawn_translation_subprocess(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            self._build_translation_subprocess_command(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(self._get_project_root()),
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+
+    def _prepare_standby_subprocess(self):
+        """
+        範囲選択の間に翻訳サブプロセスを起動しておき、SDK の読み込みと接続を済ませておく。
+        キャンセルされた場合も次のキャプチャでそのまま使う。
+        """
+        with self._standby_lock:
+            if self._standby_process is not None and self._standby_process.poll() is None:
+                return
+            try:
+                self._standby_process = self._spawn_translation_subprocess()
+            except Exception as exc:
+                logger.warning("翻訳サブプロセスの事前起動に失敗しました: %s", sanitize_sensitive_data(str(exc)))
+                self._standby_process = None
+
+    def _take_standby_subprocess(self) -> subprocess.Popen | None:
+        with self._standby_lock:
+            process, self._standby_process = self._standby_process, None
+        if process is not None and process.poll() is None:
+            return process
+        return None
+
+    def _discard_standby_subprocess(self):
+        process = self._take_standby_subprocess()
+        if process is None:
+            return
+        # 依頼を送らずに標準入力を閉じるとサブプロセスはそのまま終了する
+        try:
+            process.stdin.close()
+        except OSError:
+            process.kill()
+
+    def _build_error_result(self, message: str | None) -> dict:
+        return {
+            "translated_text": None,
+            "extracted_text": "",
+            "error_message": message,
+            "last_used_model": None,
+        }
+
+    def _handle_translation_delta(self, field: str, text: str):
+        """生成途中のテキストを対応する欄に追記する。"""
+        text_edit = {
+            "extracted_text": self.original_text_edit,
+            "translated_text": self.translation_text_edit,
+        }.get(field)
+        if text_edit is None or not text:
+            return
+        if field not in self._streaming_fields:
+            self._streaming_fields.add(field)
+            text_edit.clear()
+            setattr(self, field, "")
+            # 途中経過が見えるようにオーバーレイだけ外す（操作は完了まで無効のまま）
+            self.processing_overlay.hide()
+        text_edit.moveCursor(QTextCursor.End)
+        text_edit.insertPlainText(text)
+        # コピー対象（extracted_text / translated_text）も表示中の内容と揃えておく
+        setattr(self, field, getattr(self, field) + text)
+
     def _get_project_root(self):
         return Path(__file__).resolve().parents[2]
 
@@ -439,17 +640,27 @@ class MainWindow(QMainWindow):
         self._clear_worker_references()
         self._set_processing_state(False)
         self.show()
+        cache_key = self._pending_cache_key
+        self._pending_cache_key = None
+
+        if result.get("no_text_detected"):
+            self.status_bar.showMessage(self.tr_ui("status_no_text_detected"), 5000)
+            return
 
         extracted_text = result.get("extracted_text", "")
         translated_text = result.get("translated_text")
         error_message = result.get("error_message")
         last_used_model = result.get("last_used_model")
 
-        if extracted_text:
+        # 原文表示中は空の結果でも反映し、前回のキャプチャの原文が残らないようにする
+        if extracted_text or self.original_widget.isVisibleTo(self):
             self.extracted_text = extracted_text
             self.original_text_edit.setPlainText(extracted_text)
 
         if translated_text and not translated_text.startswith("エラー:"):
+            if cache_key is not None and not error_message:
+                with self._result_cache_lock:
+                    self._result_cache.set(cache_key, dict(result))
             self.translated_text = translated_text
             self.translation_text_edit.setPlainText(translated_text)
             if last_used_model:
@@ -463,30 +674,37 @@ class MainWindow(QMainWindow):
             self._show_overlay(translated_text)
         else:
             final_error = error_message or translated_text or self.tr_ui("generic_error")
+            # 表示中のエラーと食い違わないよう、前回の訳文はコピー対象から外す
+            self.translated_text = ""
             self.status_bar.showMessage(f"{self.tr_ui('error_title')}: {final_error}", 5000)
             self.translation_text_edit.setPlainText(self.tr_ui("translation_failed", detail=final_error))
             logger.error("翻訳失敗: %s", final_error)
 
-    def _copy_original_text(self):
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.original_text_edit.toPlainText())
-        self.status_bar.showMessage(self.tr_ui("status_copy_original"), 3000)
-
-    def _copy_translation_text(self):
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.translation_text_edit.toPlainText())
-        self.status_bar.showMessage(self.tr_ui("status_copy_translation"), 3000)
+    def _copy_result_text(self, attribute: str, status_key: str, checked: bool = False):
+        """
+        最後に取得できた原文または訳文（attribute で指定）をクリップボードにコピーする。
+        テキスト欄の文書は辿らず、保持している文字列をそのまま使う。
+        checked は clicked シグナルから渡される値で、使用しない。
+        """
+        text = getattr(self, attribute)
+        if not text:
+            return
+        self._clipboard.setText(text)
+        self.status_bar.showMessage(self.tr_ui(status_key), 3000)
 
     def _show_overlay(self, translated_text: str):
         return
 
     def _show_settings_dialog(self):
-        settings_dialog = SettingsDialog(self)
+        settings_dialog = SettingsDialog(self, self.settings_manager)
         if settings_dialog.exec_():
-            self.settings_manager.reload_settings()
+            # ダイアログは同じ SettingsManager に保存済みのため、ファイルの読み直しは不要
             self._update_ui_visibility()
             self._apply_texts()
             self.status_bar.showMessage(self.tr_ui("status_settings_saved"), 3000)
+        else:
+            # 保存に失敗したまま閉じた場合などに、未保存の入力が共有の設定に残らないよう読み直す
+            self.settings_manager.reload_settings()
 
     def _show_about_dialog(self):
         QMessageBox.about(self, self.tr_ui("about_title"), self.tr_ui("about_text"))
@@ -521,9 +739,6 @@ class MainWindow(QMainWindow):
         if eventType == b"windows_generic_MSG":
             msg = wintypes.MSG.from_address(message.__int__())
             if msg.message == WM_HOTKEY and msg.wParam == self.hotkey_id:
-                if self.worker_thread is not None:
-                    logger.info("翻訳処理中のためホットキー入力を無視しました。")
-                    return True, 0
                 logger.info("グローバルホットキーが検出されました。")
                 self.start_capture()
                 return True, 0
@@ -539,6 +754,7 @@ class MainWindow(QMainWindow):
             event.ignore()
             return
         self._unregister_global_hotkey()
+        self._discard_standby_subprocess()
         self.settings_manager.reload_settings()
         self.settings_manager.save_settings()
         logger.info("アプリケーションを終了します。")
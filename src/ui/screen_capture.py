@@ -11,8 +11,10 @@ class ScreenCaptureWindow(QWidget):
     画面全体のスクリーンショットを背景に、ユーザーがドラッグで選択した領域を
     切り出すための全画面ウィンドウ。
     """
-    # シグナル定義: 選択された領域のQPixmapを渡す
-    region_selected = pyqtSignal(QPixmap)
+    # シグナル定義: 選択された領域のQPixmapと、その領域のグローバル座標の矩形を渡す
+    region_selected = pyqtSignal(QPixmap, QRect)
+    # 選択の確定・キャンセルにかかわらず、ウィンドウが閉じられたときに発行する
+    capture_finished = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -106,7 +108,7 @@ class ScreenCaptureWindow(QWidget):
             if selection_rect.width() > 5 and selection_rect.height() > 5:
                 logger.info(f"キャプチャ領域確定: {selection_rect}")
                 captured_pixmap = self.full_pixmap.copy(selection_rect)
-                self.region_selected.emit(captured_pixmap)
+                self.region_selected.emit(captured_pixmap, selection_rect.translated(self.geometry().topLeft()))
             else:
                 logger.info("選択領域が小さすぎるためキャンセル")
 
@@ -120,6 +122,13 @@ class ScreenCaptureWindow(QWidget):
             logger.info("ユーザーにより範囲選択がキャンセルされました。")
             self.close()
 
+    def closeEvent(self, event):
+        """
+        閉じる前に capture_finished を発行し、呼び出し元に後片付けを任せる。
+        """
+        self.capture_finished.emit()
+        super().closeEvent(event)
+
     def _lock_to_screen(self, global_pos: QPoint):
         """
         ドラッグ開始時点のカーソル位置から対象モニターを確定し、
@@ -161,7 +170,7 @@ if __name__ == "__main__":
     capture_win = ScreenCaptureWindow()
 
     # シグナルとスロットを接続
-    def show_captured_image(pixmap):
+    def show_captured_image(pixmap, rect):
         label.setPixmap(pixmap.scaled(label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
         main_win.resize(pixmap.size())
         main_win.show()
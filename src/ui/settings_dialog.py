@@ -5,6 +5,7 @@ import logging
 
 from PyQt5.QtGui import QIntValidator
 from PyQt5.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QDialog,
     QFormLayout,
@@ -20,7 +21,8 @@ from PyQt5.QtWidgets import (
 
 from ..translator.translation_manager import TranslationManager
 from ..utils.localization import SUPPORTED_APP_LANGUAGES, get_language_name, get_ui_string
-from ..utils.settings_manager import SettingsManager
+from ..utils.result_cache import clear_persistent_cache
+from ..utils.settings_manager import DEFAULT_PRIMARY_MODEL, SettingsManager
 
 logger = logging.getLogger("ocr_translator")
 
@@ -28,11 +30,12 @@ logger = logging.getLogger("ocr_translator")
 class SettingsDialog(QDialog):
     """アプリケーション設定ダイアログ"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings_manager: SettingsManager | None = None):
         super().__init__(parent)
 
-        self.settings_manager = SettingsManager()
-        self.translation_manager = TranslationManager()
+        # 呼び出し元と同じ設定を使い、保存後に設定ファイルを読み直さずに済ませる
+        self.settings_manager = settings_manager or SettingsManager()
+        self.translation_manager = TranslationManager(self.settings_manager)
         self.app_language = self.settings_manager.get_app_language()
 
         self._init_ui()
@@ -146,6 +149,14 @@ class SettingsDialog(QDialog):
         self.timeout_edit.setValidator(QIntValidator(1, 300))
         api_form.addRow(self.timeout_label, self.timeout_edit)
 
+        self.persistent_cache_check = QCheckBox()
+        api_form.addRow("", self.persistent_cache_check)
+
+        self.persistent_cache_note = QLabel()
+        self.persistent_cache_note.setWordWrap(True)
+        self.persistent_cache_note.setStyleSheet("font-size: 12px; color: #666666;")
+        api_form.addRow("", self.persistent_cache_note)
+
         api_layout.addWidget(self.api_group)
 
         verify_layout = QHBoxLayout()
@@ -200,6 +211,8 @@ class SettingsDialog(QDialog):
         self.custom_model_note.setText(self.tr_ui("custom_model_note"))
         self.timeout_label.setText(self.tr_ui("timeout"))
         self.timeout_edit.setPlaceholderText("60")
+        self.persistent_cache_check.setText(self.tr_ui("persistent_cache"))
+        self.persistent_cache_note.setText(self.tr_ui("persistent_cache_note"))
         self.verify_button.setText(self.tr_ui("verify_api_key"))
         self.cancel_button.setText(self.tr_ui("cancel"))
         self.save_button.setText(self.tr_ui("save"))
@@ -215,6 +228,7 @@ class SettingsDialog(QDialog):
         self.gemini_api_key_edit.setText(gemini_api_key if gemini_api_key else "")
         self.custom_model_edit.setText(custom_model)
         self.timeout_edit.setText(str(timeout) if timeout else "")
+        self.persistent_cache_check.setChecked(self.settings_manager.get_persistent_cache_enabled())
 
         lang_index = self.app_language_combo.findData(app_language)
         self.app_language_combo.setCurrentIndex(lang_index if lang_index >= 0 else 0)
@@ -254,11 +268,17 @@ class SettingsDialog(QDialog):
             self.settings_manager.set_llm_mode(llm_mode)
             self.settings_manager.set_custom_model(custom_model if llm_mode == "custom" else "")
             self.settings_manager.set_timeout(timeout)
+            was_cache_enabled = self.settings_manager.get_persistent_cache_enabled()
+            cache_enabled = self.persistent_cache_check.isChecked()
+            self.settings_manager.set_persistent_cache_enabled(cache_enabled)
             self.settings_manager.set_app_language(app_language)
             self.settings_manager.set_selected_api("gemini")
 
             if self.settings_manager.save_settings():
                 logger.info("設定を保存しました")
+                if was_cache_enabled and not cache_enabled:
+                    # 無効にしたら保存済みの翻訳結果もディスクに残さない
+                    clear_persistent_cache()
                 self.accept()
             else:
                 QMessageBox.critical(self, self.tr_ui("error_title"), self.tr_ui("error_title"))
@@ -275,12 +295,12 @@ class SettingsDialog(QDialog):
             QMessageBox.critical(self, self.tr_ui("error_title"), self.tr_ui("missing_translator"))
             return
 
+        # 保存前の入力で検証するため、設定は変更せずに検証対象のモデルだけを渡す
         llm_mode = self.llm_mode_combo.currentData()
         custom_model = self.custom_model_edit.text().strip()
-        translator_service.settings_manager.set_llm_mode(llm_mode)
-        translator_service.settings_manager.set_custom_model(custom_model if llm_mode == "custom" else "")
+        model_name = custom_model if llm_mode == "custom" and custom_model else DEFAULT_PRIMARY_MODEL
 
-        is_valid, message = translator_service.verify_api_key(api_key)
+        is_valid, message = translator_service.verify_api_key(api_key, model_name)
         if is_valid:
             QMessageBox.information(self, self.tr_ui("verify_ok_title"), self.tr_ui("verify_ok_message"))
         else:
@@ -3,24 +3,43 @@ Google AI model selection helpers.
 """
 from __future__ import annotations
 
-from typing import Iterable
-
-from google import genai
-from google.genai import types
+import logging
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterable
 
 from .settings_manager import SettingsManager
 from .utils import sanitize_sensitive_data
 
+logger = logging.getLogger("ocr_translator")
+
+if TYPE_CHECKING:
+    # google-genai is heavy to import; load it only when a request is actually made.
+    from google import genai
+    from google.genai import types
+
 RETRYABLE_MODEL_ERROR_KEYWORDS = (
-    "429",
     "rate limit",
     "resource exhausted",
     "quota",
-    "503",
     "service unavailable",
     "unavailable",
     "overloaded",
     "temporarily unavailable",
+    "internal",
+    "deadline",
+)
+# Timeout / conflict / too-early / rate-limit and all 5xx statuses; 400/401/403 stay non-retryable.
+RETRYABLE_STATUS_CODE_PATTERN = r"\b(?:408|409|425|429|5\d\d)\b"
+TRANSIENT_RETRY_LIMIT = 2
+TRANSIENT_RETRY_BASE_DELAY = 0.5
+TRANSIENT_RETRY_JITTER = 0.25
+_RETRYABLE_MODEL_ERROR_PATTERN = re.compile(
+    "|".join([RETRYABLE_STATUS_CODE_PATTERN, *(re.escape(keyword) for keyword in RETRYABLE_MODEL_ERROR_KEYWORDS)]),
+    re.IGNORECASE,
 )
 
 
@@ -31,8 +50,9 @@ def get_google_model_candidates(settings_manager: SettingsManager) -> list[str]:
 
 def should_retry_with_fallback(exc: Exception) -> bool:
     """Return True when the error suggests temporary unavailability."""
-    message = sanitize_sensitive_data(str(exc)).lower()
-    return any(keyword in message for keyword in RETRYABLE_MODEL_ERROR_KEYWORDS)
+    # Mask secrets first so digits inside an API key cannot look like a status code.
+    message = sanitize_sensitive_data(str(exc))
+    return _RETRYABLE_MODEL_ERROR_PATTERN.search(message) is not None
 
 
 def format_model_chain(models: Iterable[str]) -> str:
@@ -40,21 +60,147 @@ def format_model_chain(models: Iterable[str]) -> str:
     return " -> ".join(model for model in models if model)
 
 
+@lru_cache(maxsize=32)
 def supports_minimal_thinking(model_name: str | None) -> bool:
     """Return True when the target model supports minimal thinking config."""
     lowered = (model_name or "").strip().lower()
     return lowered.startswith("gemini-3.1-flash-lite")
 
 
+@lru_cache(maxsize=32)
 def build_generation_config_for_model(model_name: str | None):
-    """Build per-model config. Thinking is only enabled on supported Gemini models."""
+    """
+    Build per-model config. Thinking is only enabled on supported Gemini models.
+
+    The result is memoized per model name and shared between calls, so callers must not mutate it.
+    """
     if supports_minimal_thinking(model_name):
+        from google.genai import types
+
         return types.GenerateContentConfig(
             thinking_config=types.ThinkingConfig(thinking_level="minimal")
         )
     return None
 
 
-def create_google_client(api_key: str) -> genai.Client:
-    """Create a Google GenAI client for Gemini API."""
-    return genai.Client(api_key=api_key)
+def build_image_part(image_bytes: bytes, mime_type: str = "image/png") -> types.Part:
+    """Wrap already-encoded image bytes so the SDK uploads them without re-encoding."""
+    from google.genai import types
+
+    return types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
+
+
+def generate_content_text(
+    client: genai.Client,
+    model_name: str,
+    contents,
+    config=None,
+    on_delta: Callable[[str], None] | None = None,
+) -> str:
+    """Run a generation and return its text, streaming chunks to on_delta when given."""
+    if on_delta is None:
+        response = client.models.generate_content(model=model_name, contents=contents, config=config)
+        return response.text or ""
+
+    chunks: list[str] = []
+    for chunk in client.models.generate_content_stream(model=model_name, contents=contents, config=config):
+        text = chunk.text
+        if text:
+            chunks.append(text)
+            on_delta(text)
+    return "".join(chunks)
+
+
+def generate_with_model_fallback(
+    settings_manager: SettingsManager,
+    client: genai.Client,
+    contents,
+    label: str,
+    model_candidates: list[str] | None = None,
+    on_delta: Callable[[str], None] | None = None,
+) -> tuple[str, str]:
+    """
+    Generate text with the configured models in priority order and return (text, model_name).
+
+    In auto mode a temporary failure (rate limit, overload) moves on to the next model.
+    The last model (or the only one, in custom mode) is retried with exponential backoff
+    and jitter instead. Nothing is retried once part of the output has been streamed to on_delta.
+    """
+    if model_candidates is None:
+        model_candidates = get_google_model_candidates(settings_manager)
+    allow_fallback = settings_manager.get_llm_mode() == "auto"
+    last_error: Exception | None = None
+    streamed = False
+
+    def emit_delta(text: str) -> None:
+        nonlocal streamed
+        streamed = True
+        on_delta(text)
+
+    for index, model_name in enumerate(model_candidates):
+        for attempt in range(TRANSIENT_RETRY_LIMIT + 1):
+            try:
+                text = generate_content_text(
+                    client,
+                    model_name,
+                    contents,
+                    config=build_generation_config_for_model(model_name),
+                    on_delta=emit_delta if on_delta else None,
+                )
+                if index > 0:
+                    logger.warning("%s でモデルを %s にフォールバックしました。", label, model_name)
+                return text, model_name
+            except Exception as exc:
+                last_error = exc
+                logger.warning(
+                    "%s モデル %s の呼び出しに失敗しました: %s",
+                    label,
+                    model_name,
+                    sanitize_sensitive_data(str(exc)),
+                )
+                # 途中まで表示済みの出力があれば別モデルでやり直さない
+                if streamed or not should_retry_with_fallback(exc):
+                    raise
+                if allow_fallback and index < len(model_candidates) - 1:
+                    break
+                if attempt >= TRANSIENT_RETRY_LIMIT:
+                    raise
+                # 切り替え先のモデルがない場合は、間隔を空けて同じモデルで再試行する
+                delay = TRANSIENT_RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, TRANSIENT_RETRY_JITTER)
+                logger.info("%.1f 秒後に %s を再試行します。", delay, model_name)
+                time.sleep(delay)
+
+    if last_error is not None:
+        raise last_error
+    raise RuntimeError("利用可能なGoogle AIモデルが見つかりません。")
+
+
+_client_cache: dict[tuple[str, int | None], genai.Client] = {}
+_client_cache_lock = threading.Lock()
+
+
+def create_google_client(api_key: str, timeout: int | None = None) -> genai.Client:
+    """
+    Return a Google GenAI client for Gemini API.
+
+    The client is shared per (API key, timeout) so OCR and translation calls in the same
+    process reuse one connection pool. Changing either value replaces the client.
+    timeout is in seconds and applies to every request made through the client.
+    """
+    cache_key = (api_key, timeout)
+    with _client_cache_lock:
+        client = _client_cache.get(cache_key)
+        if client is None:
+            from google import genai
+            from google.genai import types
+
+            http_options = types.HttpOptions(timeout=timeout * 1000) if timeout else None
+            client = genai.Client(api_key=api_key, http_options=http_options)
+            _client_cache.clear()
+            _client_cache[cache_key] = client
+        return client
+
+
+def request_timeout_config(timeout: float) -> dict:
+    """Build a per-request config that overrides the client timeout (seconds)."""
+    return {"http_options": {"timeout": int(timeout * 1000)}}
@@ -0,0 +1,84 @@
+"""
+キャプチャ画像のエンコード用ヘルパー。
+"""
+from __future__ import annotations
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PyQt5.QtGui import QImage, QPixmap
+
+from .settings_manager import DEFAULT_IMAGE_FORMAT, DEFAULT_IMAGE_MAX_SIDE, DEFAULT_JPEG_QUALITY
+
+# これより小さい領域は文字が潰れやすいため可逆圧縮(PNG)のまま送る
+LOSSLESS_MAX_SIDE = 200
+# Qt は PNG の quality を zlib の圧縮レベルに換算する（80 → レベル1）。
+# 送信直前の一時データなので、サイズよりエンコード速度を優先する
+PNG_QUALITY = 80
+# 文字ありとみなす最小の明暗差
+BLANK_CONTRAST_THRESHOLD = 12
+
+
+def encode_capture_image(
+    image: QPixmap | QImage,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    max_side: int = DEFAULT_IMAGE_MAX_SIDE,
+) -> bytes:
+    """
+    キャプチャ画像を送信用のバイト列にエンコードする。
+    image_format が "auto" の場合は小さな領域のみ PNG、それ以外は JPEG を使う。
+    長辺が max_side を超える画像は縮小してから送る（0 で無効）。
+    """
+    if max_side > 0 and (image.width() > max_side or image.height() > max_side):
+        image = image.scaled(max_side, max_side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    if image_format == "auto":
+        is_small = image.width() < LOSSLESS_MAX_SIDE and image.height() < LOSSLESS_MAX_SIDE
+        image_format = "png" if is_small else "jpeg"
+    if image_format == "png":
+        image_format, quality = "PNG", PNG_QUALITY
+    else:
+        image_format, quality = "JPEG", jpeg_quality
+
+    # 書き込み先の QByteArray を直接保持し、エンコード結果は bytes への一回のコピーだけで取り出す
+    data = QByteArray()
+    # 1ピクセルあたり1バイトを見込んで先に確保し、エンコード中の再確保とコピーを避ける
+    data.reserve(image.width() * image.height())
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    try:
+        image.save(buffer, image_format, quality)
+    finally:
+        buffer.close()
+    return data.data()
+
+
+def is_blank_capture(image: QImage) -> bool:
+    """
+    キャプチャがほぼ単色で文字を含まないかを判定する。
+    グレースケール画像の明暗差だけを見る保守的な判定で、迷う場合は False を返す。
+    縮小すると細い文字や薄い文字が平均化されて消えるため、元の解像度のまま判定する。
+    """
+    if image.isNull():
+        return True
+    gray = image.convertToFormat(QImage.Format_Grayscale8)
+    bits = gray.constBits()
+    bits.setsize(gray.sizeInBytes())
+    pixels = memoryview(bits)
+    row_bytes = gray.bytesPerLine()
+    width = gray.width()
+    lowest, highest = 255, 0
+    for row in range(gray.height()):
+        # 行末のパディングを除いて各行の最小・最大輝度を集計する
+        line = bytes(pixels[row * row_bytes : row * row_bytes + width])
+        lowest = min(lowest, min(line))
+        highest = max(highest, max(line))
+        if highest - lowest >= BLANK_CONTRAST_THRESHOLD:
+            return False
+    return True
+
+
+def detect_image_mime_type(image_bytes: bytes) -> str:
+    """エンコード済み画像の先頭バイトから MIME タイプを判定する。"""
+    if image_bytes[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    return "image/png"
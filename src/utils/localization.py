@@ -20,6 +20,7 @@ STRINGS = {
         "status_ready": "準備完了 (ホットキー: Ctrl+Shift+X) / 送信前に内容をご確認ください",
         "status_select_area": "画面の翻訳したい領域をドラッグで選択してください...",
         "status_capture_cancelled": "キャプチャがキャンセルされました",
+        "status_no_text_detected": "キャプチャ範囲に文字が見つからなかったため、翻訳を省略しました",
         "status_processing": "キャプチャ完了、翻訳処理中...",
         "status_processing_locked": "翻訳処理中です。完了するまでお待ちください。",
         "status_translation_done": "翻訳が完了しました。(API: GOOGLE)",
@@ -59,6 +60,8 @@ STRINGS = {
         "custom_model_placeholder": "例: gemini-2.5-pro, gemma-4-26b-a4b-it",
         "custom_model_note": "カスタム選択時のみ、入力したモデル名をそのまま Google API に渡します。",
         "timeout": "APIタイムアウト (秒):",
+        "persistent_cache": "翻訳結果をディスクに保存して再利用する",
+        "persistent_cache_note": "同じ画像や文章の結果を最大7日間このPCに保存し、次回以降は API を呼び出さずに表示します。無効にすると保存済みの結果は削除されます。",
         "verify_api_key": "APIキーを検証",
         "cancel": "キャンセル",
         "save": "保存",
@@ -79,6 +82,7 @@ STRINGS = {
         "status_ready": "Ready (Hotkey: Ctrl+Shift+X) / Check the content before sending",
         "status_select_area": "Drag to select the area you want to translate...",
         "status_capture_cancelled": "Capture was cancelled",
+        "status_no_text_detected": "No text was found in the captured area, so translation was skipped",
         "status_processing": "Capture completed. Translating...",
         "status_processing_locked": "Translation is in progress. Please wait until it finishes.",
         "status_translation_done": "Translation completed. (API: GOOGLE)",
@@ -118,6 +122,8 @@ STRINGS = {
         "custom_model_placeholder": "e.g. gemini-2.5-pro, gemma-4-26b-a4b-it",
         "custom_model_note": "Only in custom mode, the entered model name is passed directly to the Google API.",
         "timeout": "API Timeout (sec):",
+        "persistent_cache": "Save translation results to disk for reuse",
+        "persistent_cache_note": "Results for the same image or text are kept on this PC for up to 7 days and shown again without calling the API. Turning this off deletes the saved results.",
         "verify_api_key": "Verify API Key",
         "cancel": "Cancel",
         "save": "Save",
@@ -138,6 +144,7 @@ STRINGS = {
         "status_ready": "准备完成（快捷键: Ctrl+Shift+X）/ 发送前请确认内容",
         "status_select_area": "请拖动选择要翻译的区域...",
         "status_capture_cancelled": "已取消截图",
+        "status_no_text_detected": "截图区域中未检测到文字，已跳过翻译",
         "status_processing": "截图完成，正在翻译...",
         "status_processing_locked": "正在翻译中。请等待处理完成。",
         "status_translation_done": "翻译完成。(API: GOOGLE)",
@@ -177,6 +184,8 @@ STRINGS = {
         "custom_model_placeholder": "例如: gemini-2.5-pro, gemma-4-26b-a4b-it",
         "custom_model_note": "仅在自定义模式下，输入的模型名会原样传给 Google API。",
         "timeout": "API 超时（秒）：",
+        "persistent_cache": "将翻译结果保存到磁盘并复用",
+        "persistent_cache_note": "相同图片或文本的结果会在本机保存最多 7 天，之后无需调用 API 即可显示。关闭后将删除已保存的结果。",
         "verify_api_key": "验证 API 密钥",
         "cancel": "取消",
         "save": "保存",
@@ -197,6 +206,7 @@ STRINGS = {
         "status_ready": "준비 완료 (단축키: Ctrl+Shift+X) / 전송 전에 내용을 확인하세요",
         "status_select_area": "번역할 영역을 드래그해서 선택하세요...",
         "status_capture_cancelled": "캡처가 취소되었습니다",
+        "status_no_text_detected": "캡처 영역에서 텍스트를 찾지 못해 번역을 건너뛰었습니다",
         "status_processing": "캡처 완료, 번역 중...",
         "status_processing_locked": "번역 처리 중입니다. 완료될 때까지 기다려 주세요.",
         "status_translation_done": "번역이 완료되었습니다. (API: GOOGLE)",
@@ -236,6 +246,8 @@ STRINGS = {
         "custom_model_placeholder": "예: gemini-2.5-pro, gemma-4-26b-a4b-it",
         "custom_model_note": "사용자 지정 모드에서만 입력한 모델명을 그대로 Google API에 전달합니다.",
         "timeout": "API 타임아웃(초):",
+        "persistent_cache": "번역 결과를 디스크에 저장해 재사용",
+        "persistent_cache_note": "같은 이미지나 문장의 결과를 이 PC에 최대 7일간 저장하고, 이후에는 API를 호출하지 않고 표시합니다. 끄면 저장된 결과가 삭제됩니다.",
         "verify_api_key": "API 키 확인",
         "cancel": "취소",
         "save": "저장",
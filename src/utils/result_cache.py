@@ -0,0 +1,187 @@
+"""
+翻訳結果キャッシュのユーティリティ。
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from .utils import get_cache_dir
+
+logger = logging.getLogger("ocr_translator")
+
+PERSISTENT_CACHE_FILENAME = "result_cache.sqlite3"
+PERSISTENT_CACHE_MAX_ENTRIES = 512
+# モデルの更新などで結果が古くならないよう、保存から一定期間を過ぎたエントリは使わない
+PERSISTENT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def image_digest(image_bytes: bytes) -> bytes:
+    """画像バイト列からキャッシュキー用のダイジェストを計算する。"""
+    return hashlib.blake2b(image_bytes, digest_size=16).digest()
+
+
+def build_cache_key(*parts: str | bytes) -> bytes:
+    """複数の要素から永続キャッシュ用のキーを作る。"""
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        hasher.update(len(data).to_bytes(8, "little"))
+        hasher.update(data)
+    return hasher.digest()
+
+
+class LRUCache:
+    """件数上限付きの簡易LRUキャッシュ。"""
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """キーに対応する値を返し、最近使用したものとして扱う。"""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """値を格納し、上限を超えた古いエントリを破棄する。"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """すべてのエントリを破棄する。"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PersistentCache:
+    """
+    SQLite に保存する永続キャッシュ。
+    翻訳はキャプチャごとのサブプロセスで動くため、プロセスをまたいで結果を再利用する。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = PERSISTENT_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = PERSISTENT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv ("
+                "key BLOB PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL, created INTEGER NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: bytes) -> str | None:
+        """キーに対応する値を返す。見つからない場合、期限切れの場合、読み込みに失敗した場合は None。"""
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT value, created FROM kv WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            now = time.time_ns()
+            if now - row[1] > self.ttl_seconds * 1_000_000_000:
+                conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            conn.execute("UPDATE kv SET ts = ? WHERE key = ?", (now, key))
+            conn.commit()
+            return row[0]
+        except sqlite3.Error as exc:
+            logger.warning("キャッシュの読み込みに失敗しました: %s", exc)
+            return None
+
+    def set(self, key: bytes, value: str) -> None:
+        """値を保存し、上限を超えた場合は最近使われていないエントリから削除する。"""
+        try:
+            conn = self._connect()
+            now = time.time_ns()
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value, ts, created) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM kv").fetchone()
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM kv WHERE key NOT IN (SELECT key FROM kv ORDER BY ts DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+            conn.commit()
+        except sqlite3.Error as exc:
+            logger.warning("キャッシュの書き込みに失敗しました: %s", exc)
+
+    def close(self) -> None:
+        """接続を閉じる。次回の get / set で開き直す。"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_persistent_cache: PersistentCache | None = None
+
+
+def _get_persistent_cache_path(create_dir: bool = True) -> str:
+    return os.path.join(get_cache_dir(create=create_dir), PERSISTENT_CACHE_FILENAME)
+
+
+def get_persistent_cache() -> PersistentCache:
+    """プロセス内で共有する永続キャッシュを返す。"""
+    global _persistent_cache
+    if _persistent_cache is None:
+        _persistent_cache = PersistentCache(_get_persistent_cache_path())
+    return _persistent_cache
+
+
+def clear_persistent_cache() -> None:
+    """
+    永続キャッシュのファイルを削除する。
+    別プロセスが開いていて削除できない場合は、保存済みのエントリをすべて消去する。
+    """
+    if _persistent_cache is not None:
+        _persistent_cache.close()
+    # 削除のためだけにキャッシュディレクトリを作らないよう、存在確認だけを行う
+    path = _get_persistent_cache_path(create_dir=False)
+    if not os.path.exists(path):
+        return
+    try:
+        for suffix in ("-wal", "-shm", ""):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        logger.info("永続キャッシュを削除しました。")
+        return
+    except OSError as exc:
+        logger.warning("永続キャッシュのファイルを削除できないため、内容のみ消去します: %s", exc)
+    try:
+        conn = sqlite3.connect(path, timeout=5)
+        try:
+            conn.execute("DELETE FROM kv")
+            conn.commit()
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+    except sqlite3.Error as exc:
+        logger.warning("永続キャッシュの消去に失敗しました: %s", exc)
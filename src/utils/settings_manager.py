@@ -17,6 +17,10 @@ SUPPORTED_API_TYPES = ("gemini",)
 DEFAULT_PRIMARY_MODEL = "gemini-3.1-flash-lite-preview"
 DEFAULT_FALLBACK_MODEL = "gemma-4-26b-a4b-it"
 DEFAULT_LLM_MODE = "auto"
+IMAGE_FORMATS = ("auto", "png", "jpeg")
+DEFAULT_IMAGE_FORMAT = "auto"
+DEFAULT_JPEG_QUALITY = 85
+DEFAULT_IMAGE_MAX_SIDE = 1568
 
 
 class SettingsManager:
@@ -27,6 +31,8 @@ class SettingsManager:
         self.config_file = os.path.join(self.config_dir, "settings.json")
         self._last_loaded_mtime: float | None = None
         self._last_mtime_check: float | None = None
+        # (保存値, 復号済みAPIキー)。保存値が変わらない限り DPAPI の復号を繰り返さない
+        self._api_key_cache: tuple[str, str] | None = None
         self.settings = self._load_settings()
 
     def _default_settings(self) -> Dict[str, Any]:
@@ -48,6 +54,15 @@ class SettingsManager:
                 "start_minimized": False,
                 "transcribe_original_text": False,
             },
+            "cache": {
+                # 画面の文字を平文でディスクに残すため、利用者が有効にした場合のみ保存する
+                "persistent_enabled": False,
+            },
+            "image": {
+                "format": DEFAULT_IMAGE_FORMAT,
+                "jpeg_quality": DEFAULT_JPEG_QUALITY,
+                "max_side": DEFAULT_IMAGE_MAX_SIDE,
+            },
         }
 
     def _load_settings(self) -> Dict[str, Any]:
@@ -242,7 +257,13 @@ class SettingsManager:
             logger.warning("未対応のAPIキーが要求されました: %s", api_type)
             return None
         stored = self.get_setting("api", "gemini_api_key")
-        return secure_storage.unprotect_secret(stored)
+        cached = self._api_key_cache
+        if cached is not None and cached[0] == stored:
+            return cached[1]
+        api_key = secure_storage.unprotect_secret(stored)
+        if api_key:
+            self._api_key_cache = (stored, api_key)
+        return api_key
 
     def set_api_key(self, api_type: str, api_key: str) -> bool:
         """Store API key for the requested provider."""
@@ -370,3 +391,47 @@ class SettingsManager:
     def set_transcribe_original_text(self, value: bool) -> bool:
         """Persist transcription flag."""
         return self.set_setting("ui", "transcribe_original_text", value)
+
+    def get_persistent_cache_enabled(self) -> bool:
+        """Return whether OCR / translation results may be cached on disk."""
+        return bool(self.get_setting("cache", "persistent_enabled", False))
+
+    def set_persistent_cache_enabled(self, value: bool) -> bool:
+        """Persist the on-disk result cache flag."""
+        return self.set_setting("cache", "persistent_enabled", bool(value))
+
+    def get_image_format(self) -> str:
+        """Return the capture encoding: "auto" (PNG for small captures, JPEG otherwise), "png" or "jpeg"."""
+        value = self.get_setting("image", "format", DEFAULT_IMAGE_FORMAT)
+        return value if value in IMAGE_FORMATS else DEFAULT_IMAGE_FORMAT
+
+    def set_image_format(self, image_format: str) -> bool:
+        """Persist the capture encoding."""
+        normalized = (image_format or DEFAULT_IMAGE_FORMAT).strip().lower()
+        if normalized not in IMAGE_FORMATS:
+            normalized = DEFAULT_IMAGE_FORMAT
+        return self.set_setting("image", "format", normalized)
+
+    def get_jpeg_quality(self) -> int:
+        """Return the JPEG quality (1-100) used for capture encoding."""
+        value = self.get_setting("image", "jpeg_quality", DEFAULT_JPEG_QUALITY)
+        try:
+            return min(100, max(1, int(value)))
+        except (TypeError, ValueError):
+            return DEFAULT_JPEG_QUALITY
+
+    def set_jpeg_quality(self, quality: int) -> bool:
+        """Persist the JPEG quality used for capture encoding."""
+        return self.set_setting("image", "jpeg_quality", min(100, max(1, int(quality))))
+
+    def get_image_max_side(self) -> int:
+        """Return the longest edge (px) captures are downscaled to before encoding; 0 disables it."""
+        value = self.get_setting("image", "max_side", DEFAULT_IMAGE_MAX_SIDE)
+        try:
+            return max(0, int(value))
+        except (TypeError, ValueError):
+            return DEFAULT_IMAGE_MAX_SIDE
+
+    def set_image_max_side(self, max_side: int) -> bool:
+        """Persist the downscale threshold for captures."""
+        return self.set_setting("image", "max_side", max(0, int(max_side)))
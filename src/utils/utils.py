@@ -87,3 +87,9 @@ def get_config_dir() -> str:
     """設定ファイル用のディレクトリパスを取得する"""
     config_dir = os.path.join(os.path.expanduser('~'), '.ocr_translator', 'config')
     return ensure_dir(config_dir)
+
+
+def get_cache_dir(create: bool = True) -> str:
+    """キャッシュファイル用のディレクトリパスを取得する（create=False の場合は作成しない）"""
+    cache_dir = os.path.join(os.path.expanduser('~'), '.ocr_translator', 'cache')
+    return ensure_dir(cache_dir) if create else cache_dir